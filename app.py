@@ -1,31 +1,177 @@
 import base64
+import binascii
+import hashlib
 import io
 import json
+import os
 import tempfile
 from collections import Counter
-from pathlib import Path
 
+import numpy as np
 import pandas as pd
-from dash import Dash, html, dcc, dash_table, Input, Output, State
+from dash import Dash, html, dcc, dash_table, Input, Output, State, ClientsideFunction
+from flask_caching import Cache
 
 # Your audit engine + exporter
 import run_audit as ra
 from report.html_report import render_report
+from report.finding_view import build_finding_view
+
+# optional: numba-compiled outlier kernel (falls back to numpy)
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 
 # -----------------------
 # Helpers
 # -----------------------
-def parse_contents(contents, filename):
-    """Decode uploaded file into a pandas DataFrame."""
-    content_type, content_string = contents.split(",")
-    decoded = base64.b64decode(content_string)
-    if filename.lower().endswith(".csv"):
-        return pd.read_csv(io.StringIO(decoded.decode("utf-8", errors="ignore")))
-    elif filename.lower().endswith((".xls", ".xlsx")):
-        return pd.read_excel(io.BytesIO(decoded))
-    else:
+# base64 text is decoded 64 KiB at a time (a multiple of 4, so every slice
+# decodes on its own); decoded bytes stay in RAM up to 4 MB, then spill to disk
+B64_CHUNK_CHARS = 64 * 1024
+SPOOL_MAX_BYTES = 4 << 20
+# leading bytes of .xlsx (zip) and legacy .xls (OLE2) files
+EXCEL_MAGIC = (b"PK\x03\x04", b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1")
+# rows shown in the Data Preview
+PREVIEW_ROWS = 5
+# largest-magnitude values listed per IQR outlier column
+OUTLIER_SAMPLE = 10
+# report bytes are buffered and base64-encoded 3 * 57 KiB at a time
+B64_ENCODE_CHUNK_BYTES = 3 * 57 * 1024
+
+
+def _decode_to_spool(content_string):
+    """Decode base64 upload text in bounded chunks into a spooled temp file."""
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    for i in range(0, len(content_string), B64_CHUNK_CHARS):
+        spool.write(binascii.a2b_base64(content_string[i:i + B64_CHUNK_CHARS]))
+    spool.seek(0)
+    return spool
+
+
+def _iqr_outliers_np(block, lo, hi):
+    """numpy version of iqr_outliers."""
+    k = block.shape[1]
+    mask = ((block < lo) | (block > hi)).T  # NaN compares False
+    top = np.full((k, OUTLIER_SAMPLE), -1, dtype=np.int64)
+    for j in range(k):
+        arr = block[:, j]
+        pos = np.flatnonzero(mask[j])
+        # O(N) selection of the largest magnitudes, then order just those; ties at the
+        # cut keep the earliest rows, as the numba kernel does (pos is ascending)
+        if len(pos) > OUTLIER_SAMPLE:
+            a = np.abs(arr[pos])
+            cut = np.partition(a, len(a) - OUTLIER_SAMPLE)[len(a) - OUTLIER_SAMPLE]
+            above = a > cut
+            pos = np.concatenate([pos[above], pos[a == cut][:OUTLIER_SAMPLE - int(above.sum())]])
+            pos.sort()
+        pos = pos[np.argsort(-np.abs(arr[pos]), kind="stable")]
+        top[j, :len(pos)] = pos
+    return mask, top
+
+
+if njit is not None:
+    # not parallel=True: a parallel kernel called from a worker thread (Dash's threaded
+    # server, gunicorn threads) leaves numba's TBB threading layer running at exit
+    @njit(cache=True)
+    def iqr_outliers(block, lo, hi):
+        """Outliers of each column j of `block` (N, K) outside [lo[j], hi[j]].
+
+        Returns a (K, N) mask and the (K, OUTLIER_SAMPLE) row positions of the
+        largest |values| in descending order, earlier rows first on ties (-1
+        padded). One fused pass per column.
+        """
+        n, k = block.shape
+        mask = np.zeros((k, n), dtype=np.bool_)
+        top = np.full((k, OUTLIER_SAMPLE), -1, dtype=np.int64)
+        for j in range(k):
+            lo_j = lo[j]
+            hi_j = hi[j]
+            filled = 0
+            for i in range(n):
+                v = block[i, j]
+                if v < lo_j or v > hi_j:
+                    mask[j, i] = True
+                    a = abs(v)
+                    # insertion into the small sorted top list
+                    if filled < OUTLIER_SAMPLE:
+                        p = filled
+                        filled += 1
+                    elif a > abs(block[top[j, OUTLIER_SAMPLE - 1], j]):
+                        p = OUTLIER_SAMPLE - 1
+                    else:
+                        continue
+                    while p > 0 and abs(block[top[j, p - 1], j]) < a:
+                        top[j, p] = top[j, p - 1]
+                        p -= 1
+                    top[j, p] = i
+        return mask, top
+else:
+    iqr_outliers = _iqr_outliers_np
+
+
+class B64Writer(io.RawIOBase):
+    """Write-only binary sink that base64-encodes bytes as they arrive.
+
+    Input is encoded in 3-byte-aligned runs (the tail waits for the next write
+    or close), so the collected pieces join into one valid payload.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.out = []
+        self._rem = b""
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        data = self._rem + bytes(b)
+        cut = len(data) - len(data) % 3
+        if cut:
+            self.out.append(binascii.b2a_base64(data[:cut], newline=False).decode("ascii"))
+        self._rem = data[cut:]
+        return len(b)
+
+    def close(self):
+        if not self.closed and self._rem:
+            self.out.append(binascii.b2a_base64(self._rem, newline=False).decode("ascii"))
+            self._rem = b""
+        super().close()
+
+    def getvalue(self):
+        return "".join(self.out)
+
+
+def parse_contents(contents, filename, preview_only=False):
+    """Decode uploaded file into a pandas DataFrame.
+
+    With preview_only, only the first PREVIEW_ROWS rows are parsed.
+    """
+    content_type, content_string = contents.split(",", 1)
+    name = filename.lower()
+    if not name.endswith((".csv", ".xls", ".xlsx")):
         raise ValueError("Unsupported file format. Use CSV or Excel.")
+    # cheap rejections before any large allocation: size from the base64 length,
+    # format from the first few decoded bytes
+    limit = app.server.config["MAX_CONTENT_LENGTH"]
+    if len(content_string) * 3 // 4 > limit:
+        raise ValueError(f"File is too large (limit {limit // (1024 * 1024)} MB).")
+    head = binascii.a2b_base64(content_string[:64])
+    if name.endswith(".csv"):
+        if head.startswith(EXCEL_MAGIC) or b"\x00" in head:
+            raise ValueError("File does not look like a CSV (binary content).")
+    elif not head.startswith(EXCEL_MAGIC):
+        raise ValueError("File does not look like an Excel workbook.")
+    with _decode_to_spool(content_string) as spool:
+        if name.endswith(".csv"):
+            if preview_only:
+                # the pyarrow engine has no nrows; the C engine stops after a few rows
+                return pd.read_csv(spool, nrows=PREVIEW_ROWS, encoding_errors="ignore")
+            return ra.read_csv(spool)
+        # xlsx is read via openpyxl in read-only mode, which stops after nrows
+        return pd.read_excel(spool, nrows=PREVIEW_ROWS if preview_only else None)
 
 
 FRIENDLY = {
@@ -42,12 +188,28 @@ FRIENDLY = {
 }
 
 
+# FRIENDLY keys grouped by first word (in FRIENDLY order), so a finding name is
+# only prefix-tested against the few keys that can match it
+_FRIENDLY_BY_FIRST = {}
+for _k in FRIENDLY:
+    _FRIENDLY_BY_FIRST.setdefault(_k.split()[0], []).append(_k)
+
+
+def friendly_key(name: str):
+    """FRIENDLY key that `name` starts with, or None."""
+    words = name.split(maxsplit=1)
+    for cand in _FRIENDLY_BY_FIRST.get(words[0] if words else "", ()):
+        if name.startswith(cand):
+            return cand
+    return None
+
+
 def badge(sev: str):
     return html.Span(sev.title(), className=f"badge {sev}")
 
 
-def card(title, *children):
-    return html.Div(className="card", children=[html.Div(className="card-title", children=title), *children])
+def card(title, *children, **props):
+    return html.Div(className="card", children=[html.Div(className="card-title", children=title), *children], **props)
 
 
 # -----------------------
@@ -73,6 +235,14 @@ def _allow_iframe(resp):
 # cap upload size to 25 MB (adjust if you want)
 app.server.config["MAX_CONTENT_LENGTH"] = 25 * 1024 * 1024
 
+# audit results are memoized in this process's memory, never on disk: they hold
+# sample rows and values of the upload. Re-running the same file + baseline is a
+# cache hit (entries expire after 1h; the privacy texts below say so)
+cache = Cache(app.server, config={
+    "CACHE_TYPE": "SimpleCache",
+    "CACHE_DEFAULT_TIMEOUT": 3600,
+})
+
 # SEO/OpenGraph for LinkedIn/Twitter sharing
 app.index_string = """
 <!DOCTYPE html>
@@ -179,8 +349,10 @@ app.layout = html.Div(className="container", children=[
                    href="https://shannonwiseanalytics.com/", target="_blank", rel="noopener")
         ]),
         html.Div(className="disclaimer",
-            children=("Privacy: files you upload are processed in memory to generate this report and are not persisted. "
-                      "No data is sent to third-party APIs. Temporary artifacts are deleted automatically. "
+            children=("Privacy: files you upload are processed to generate this report and are not persisted. "
+                      f"Uploads over {SPOOL_MAX_BYTES >> 20} MB are buffered in a temporary file that is deleted once parsed; audit "
+                      "results (including sample rows) stay in server memory for up to an hour so re-runs are instant. "
+                      "No data is sent to third-party APIs. "
                       "Please avoid uploading highly sensitive or regulated data."))
     ])
 ])
@@ -218,11 +390,11 @@ def preview(contents, filename):
     if not contents:
         return html.Div(className="muted", children="Upload a dataset to see a quick preview.")
     try:
-        df = parse_contents(contents, filename)
+        df = parse_contents(contents, filename, preview_only=True)
         return dash_table.DataTable(
             columns=[{"name": c, "id": c} for c in df.columns],
-            data=df.head(5).to_dict("records"),
-            page_size=5, style_table={"overflowX": "auto"}
+            data=df.head(PREVIEW_ROWS).to_dict("records"),
+            page_size=PREVIEW_ROWS, style_table={"overflowX": "auto"}
         )
     except Exception as e:
         return html.Div(className="muted", children=f"Could not preview file: {e}")
@@ -231,58 +403,43 @@ def preview(contents, filename):
 # -----------------------
 # Main audit: run checks and build enriched results
 # -----------------------
-@app.callback(
-    Output("status", "children"),
-    Output("exec-summary", "children"),
-    Output("download-link", "children"),
-    Output("results-store", "data"),
-    Input("run-btn", "n_clicks"),
-    State("upload-data", "contents"), State("upload-data", "filename"),
-    State("upload-baseline", "contents"), State("upload-baseline", "filename"),
-    prevent_initial_call=True
-)
-def run(n, data_contents, data_name, base_contents, base_name):
-    if not data_contents:
-        return "No data file uploaded.", [], [], None
+def _digest(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
 
+
+@cache.memoize(timeout=3600, args_to_ignore=["data_contents", "baseline"])
+def _run_audit(data_sha, baseline_sha, data_name, data_contents, baseline):
+    """Parse + check + enrich one upload. Memoized on the content hashes (and
+    file name, which picks the parser), so the raw payload is never hashed by
+    the cache itself. Returns a pickle-safe dict."""
     try:
         df = parse_contents(data_contents, data_name)
     except Exception as e:
-        return f"Failed to read data: {e}", [], [], None
-
-    baseline = None
-    if base_contents and base_name:
-        try:
-            _, content_string = base_contents.split(",")
-            baseline = json.loads(base64.b64decode(content_string).decode("utf-8"))
-        except Exception as e:
-            return f"Failed to read baseline: {e}", [], [], None
+        return {"error": f"Failed to read data: {e}"}
 
     # run all checks
-    results = []
-    results += ra.check_schema(df, baseline)
-    if baseline and "primary_key" in baseline:
-        results += ra.check_primary_key(df, baseline.get("primary_key", []))
-    results += ra.check_missing_duplicates_types(df)
-    results += ra.check_outliers_iqr(df)
-    results += ra.check_rare_categories(df)
-    results += ra.check_semantic_regex(df)
-    results += ra.check_dates(df)
+    results = ra.run_checks(df, baseline)
 
     # enrich: duplicates (row indices + sample rows)
     try:
-        dup_df = df[df.duplicated(keep=False)]
-        if not dup_df.empty:
+        # same equality as the count in "Duplicate Rows" (duplicated(), exact on wide frames too)
+        dup_mask = ra.duplicate_row_mask(df, keep=False)
+        if dup_mask.any():
+            dup_pos = np.flatnonzero(dup_mask)
             for r in results:
                 if r.name == "Duplicate Rows" and r.issues:
-                    r.issues[0]["row_indices"] = [int(i) if isinstance(i, (int, float)) else str(i) for i in dup_df.index]
-                    r.issues[0]["sample_rows"] = dup_df.head(10).to_dict("records")
+                    r.issues[0]["row_indices"] = [int(i) if isinstance(i, (int, float)) else str(i)
+                                                  for i in df.index[dup_pos]]
+                    # columnar: row values only, keyed by "columns" below (no per-row key repeats)
+                    # per column (not .values): an int column next to a float one stays int
+                    r.issues[0]["sample_rows"] = {"rows": df.iloc[dup_pos[:10]].to_dict("split", index=False)["data"]}
                     r.issues[0]["columns"] = list(df.columns)
                     break
     except Exception:
         pass
 
     # enrich: IQR outliers (row indices + sample values) per affected column
+    targets = []
     for r in results:
         if r.name.startswith("IQR Outliers"):
             # parse column name after colon
@@ -291,25 +448,75 @@ def run(n, data_contents, data_name, base_contents, base_name):
             except Exception:
                 col = None
             if col and col in df.columns and r.issues:
-                info = r.issues[0]
-                lo = info.get("lo")
-                hi = info.get("hi")
-                s = pd.to_numeric(df[col], errors="coerce")
-                mask = (s < lo) | (s > hi)
-                idxs = s[mask].index.tolist()
-                sample = [{"index": idx, "value": None if pd.isna(s.loc[idx]) else float(s.loc[idx])}
-                          for idx in s[mask].sort_values(key=lambda x: x.abs(), ascending=False).head(10).index]
-                info["column"] = col
-                info["row_indices"] = [int(i) if isinstance(i, (int, float)) else str(i) for i in idxs]
-                info["sample_values"] = sample
-                info["explain"] = (
-                    "Outliers flagged using the IQR rule: values lower than Q1−1.5×IQR or higher than Q3+1.5×IQR. "
-                    f"For “{col}”, the low/high cutoffs are {lo:.3f} / {hi:.3f}."
-                )
+                targets.append((r.issues[0], col))
+    if targets:
+        # numeric projection of each affected column, computed once up front
+        outlier_cols = {col for _, col in targets}
+        coerced = {col: pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+                   for col in outlier_cols}
+        # all affected columns as one column-major float64 block for a single kernel call
+        block = np.empty((len(df), len(targets)), dtype=np.float64, order="F")
+        for j, (_, col) in enumerate(targets):
+            block[:, j] = coerced[col]
+        los = np.array([info.get("lo") for info, _ in targets], dtype=np.float64)
+        his = np.array([info.get("hi") for info, _ in targets], dtype=np.float64)
+        mask, top = iqr_outliers(block, los, his)
+        index = df.index.to_numpy()
+        for j, (info, col) in enumerate(targets):
+            lo = info.get("lo")
+            hi = info.get("hi")
+            idxs = index[mask[j]].tolist()
+            tj = top[j][top[j] >= 0]
+            sample = [{"index": idx, "value": float(v)} for idx, v in zip(index[tj].tolist(), block[tj, j])]
+            info["column"] = col
+            info["row_indices"] = [int(i) if isinstance(i, (int, float)) else str(i) for i in idxs]
+            info["sample_values"] = sample
+            info["explain"] = (
+                "Outliers flagged using the IQR rule: values lower than Q1−1.5×IQR or higher than Q3+1.5×IQR. "
+                f"For “{col}”, the low/high cutoffs are {lo:.3f} / {hi:.3f}."
+            )
+
+    return {
+        "rows": len(df),
+        "columns": list(df.columns),
+        "results": [{"name": r.name, "severity": r.severity, "impact": r.impact, "issues": r.issues} for r in results],
+        "score": ra.compute_score(results),
+    }
+
+
+@app.callback(
+    Output("status", "children"),
+    Output("exec-summary", "children"),
+    Output("download-link", "children"),
+    Output("results-store", "data"),
+    Input("run-btn", "n_clicks"),
+    State("upload-data", "contents"), State("upload-data", "filename"),
+    State("upload-baseline", "contents"), State("upload-baseline", "filename"),
+    prevent_initial_call=True
+)
+def run(n, data_contents, data_name, base_contents, base_name):
+    if not data_contents:
+        return "No data file uploaded.", [], [], None
+
+    baseline = None
+    baseline_json = ""
+    if base_contents and base_name:
+        try:
+            _, content_string = base_contents.split(",")
+            baseline_json = base64.b64decode(content_string).decode("utf-8")
+            baseline = json.loads(baseline_json)
+        except Exception as e:
+            return f"Failed to read baseline: {e}", [], [], None
+
+    # hash the base64 payload itself: same bytes, same key, no extra decode
+    audit = _run_audit(_digest(data_contents), _digest(baseline_json), data_name, data_contents, baseline)
+    if "error" in audit:
+        return audit["error"], [], [], None
+    results = audit["results"]
 
     # numbers for summary
-    score = ra.compute_score(results)
-    sev_counts = Counter([r.severity for r in results])
+    score = audit["score"]
+    sev_counts = Counter([r["severity"] for r in results])
 
     summary = html.Div(className="cards", children=[
         card("Overall score", html.Div(str(score), className="big")),
@@ -318,121 +525,112 @@ def run(n, data_contents, data_name, base_contents, base_name):
             html.Div(["Major: ", str(sev_counts.get("major", 0))]),
             html.Div(["Minor: ", str(sev_counts.get("minor", 0))]),
         ])),
-        card("Dataset", html.Div([html.Div(f"Rows: {len(df)}"), html.Div(f"Columns: {len(df.columns)}")])),
+        card("Dataset", html.Div([html.Div(f"Rows: {audit['rows']}"), html.Div(f"Columns: {len(audit['columns'])}")])),
     ])
 
-    # build themed HTML report with the enriched results
-    with tempfile.TemporaryDirectory() as td:
-        out_path = Path(td) / "report.html"
+    # render the themed HTML report straight into its base64 download payload
+    w = B64Writer()
+    with io.TextIOWrapper(io.BufferedWriter(w, buffer_size=B64_ENCODE_CHUNK_BYTES), encoding="utf-8") as fh:
         render_report({
             "file": data_name,
-            "rows": len(df),
-            "columns": list(df.columns),
-            "results": [r.__dict__ for r in results],  # enriched
+            "rows": audit["rows"],
+            "columns": audit["columns"],
+            "results": results,  # enriched
             "score": score,
             "credit_html": ('Created by <strong>Shannon Wise</strong> · '
                             '<a href="https://shannonwiseanalytics.com/" target="_blank" rel="noopener">'
                             'shannonwiseanalytics.com</a>'),
-            "privacy_html": ("Privacy: files you upload are processed in memory and not persisted. "
-                             "No data is sent to third-party APIs. Temporary artifacts are deleted automatically. "
+            "privacy_html": ("Privacy: files you upload are processed and not persisted. "
+                             f"Uploads over {SPOOL_MAX_BYTES >> 20} MB are buffered in a temporary file that is deleted once parsed; "
+                             "audit results stay in server memory for up to an hour. "
+                             "No data is sent to third-party APIs. "
                              "Avoid uploading highly sensitive/regulated data.")
-        }, str(out_path))
-        html_bytes = out_path.read_bytes()
+        }, fh)
+    b64_html = w.getvalue()
 
-    b64_html = base64.b64encode(html_bytes).decode("utf-8")
     download = html.A("Download full HTML report",
                       href=f"data:text/html;base64,{b64_html}",
                       download="dq_ai_report.html",
                       className="btn")
 
     # store lean version for interactive rendering
-    store = {"results": [{"name": r.name, "severity": r.severity, "impact": r.impact, "issues": r.issues} for r in results]}
+    store = {"results": results}
     status = f"Audit complete. Score: {score}"
     return status, summary, download, store
 
 
 # -----------------------
-# Filter-driven rendering (no re-run)
+# Findings rendering: once per audit; the severity filter only sets classes on
+# the containers in the browser (assets/sev_filter.js, rules in theme.css)
 # -----------------------
+# top-fixes variant for each critical/major selection (keys match theme.css)
+TOP_FIX_GROUPS = [("critical major", ("critical", "major")), ("critical", ("critical",)),
+                  ("major", ("major",)), ("none", ())]
+
+
 @app.callback(
     Output("top-fixes", "children"),
     Output("findings", "children"),
-    Input("sev-filter", "value"),
-    State("results-store", "data"),
+    Input("results-store", "data"),
     prevent_initial_call=True
 )
-def render_filtered(sev_filter, store):
+def render_findings(store):
     if not store or not store.get("results"):
         return [], []
 
     res = store["results"]
-    allowed = set(sev_filter or [])
-    filtered = [r for r in res if r["severity"] in allowed]
 
     # top fixes
-    top = sorted([r for r in filtered if r["severity"] in ("critical", "major")],
-                 key=lambda x: x["impact"], reverse=True)[:3]
-    fixes = []
-    for r in top:
-        fk = next((k for k in FRIENDLY if r["name"].startswith(k)), r["name"])
-        what, how = FRIENDLY.get(fk, ("Issue detected.", "Review and fix in source/ETL."))
-        fixes.append(html.Li(html.Span([html.Strong(fk), badge(r["severity"]), html.Span(f" — {what}  Fix: {how}")])))
-    topfixes = card("Top fixes (start here)", html.Ul(fixes or [html.Li("No high-impact issues.")]))
+    groups = []
+    for key, sevs in TOP_FIX_GROUPS:
+        top = sorted([r for r in res if r["severity"] in sevs], key=lambda x: x["impact"], reverse=True)[:3]
+        fixes = []
+        for r in top:
+            fk = friendly_key(r["name"]) or r["name"]
+            what, how = FRIENDLY.get(fk, ("Issue detected.", "Review and fix in source/ETL."))
+            fixes.append(html.Li(html.Span([html.Strong(fk), badge(r["severity"]), html.Span(f" — {what}  Fix: {how}")])))
+        groups.append(html.Ul(fixes or [html.Li("No high-impact issues.")], **{"data-fixes": key}))
+    topfixes = card("Top fixes (start here)", *groups)
 
     # findings
     finding_cards = []
-    for r in filtered:
-        title = r["name"]; sev = r["severity"]; issues = r.get("issues", [])
-        fk = next((k for k in FRIENDLY if title.startswith(k)), None)
+    for r in res:
+        title = r["name"]; sev = r["severity"]
+        fk = friendly_key(title)
         friendly = (html.P([html.Span(FRIENDLY[fk][0] + " "), html.Em("Fix: " + FRIENDLY[fk][1])])
                     if fk else html.P("See details below."))
 
-        # default details
-        details = html.Ul([html.Li(json.dumps(i)) for i in issues])
-
-        # Duplicate Rows → show row indices + a sample table if present
-        if title == "Duplicate Rows" and issues:
-            info = issues[0]
-            rows = info.get("row_indices", [])
-            sample_rows = info.get("sample_rows", [])
-            cols = info.get("columns", [])
-            parts = [html.P(f"Duplicate rows detected: {len(rows)}")]
-            if rows:
-                preview_list = ", ".join([str(x) for x in rows[:20]]) + (" …" if len(rows) > 20 else "")
-                parts.append(html.P(f"Row indices (sample): {preview_list}"))
-            if sample_rows:
-                parts.append(dash_table.DataTable(
-                    columns=[{"name": c, "id": c} for c in cols],
-                    data=sample_rows, page_size=5, style_table={"overflowX": "auto"}
-                ))
-            details = html.Div(parts)
-
-        # IQR Outliers → explanation + sample index/value table
-        if title.startswith("IQR Outliers") and issues:
-            info = issues[0]
-            explain = info.get("explain")
-            sample_vals = info.get("sample_values", [])
-            parts = []
-            if explain:
-                parts.append(html.P(explain))
-            if "row_indices" in info:
-                parts.append(html.P(f"Outlier rows (count): {len(info['row_indices'])}"))
-            if sample_vals:
-                parts.append(dash_table.DataTable(
-                    columns=[{"name": "index", "id": "index"}, {"name": "value", "id": "value"}],
-                    data=sample_vals, page_size=6, style_table={"overflowX": "auto"}
-                ))
-            details = html.Div(parts)
-
-        finding_cards.append(card(title, badge(sev), friendly, details))
+        # details from the view shared with the HTML report
+        view = build_finding_view(r)
+        parts = [html.P(text if strong is None else [f"{text}: ", html.Strong(str(strong))])
+                 for text, strong in view["paras"]]
+        if view["table"]:
+            ids = [str(c) for c in view["table"]["cols"]]
+            parts.append(dash_table.DataTable(
+                columns=[{"name": c, "id": c} for c in ids],
+                data=[dict(zip(ids, row)) for row in view["table"]["rows"]],
+                page_size=view["table"]["page_size"], style_table={"overflowX": "auto"}
+            ))
+        if view["items"] is not None:
+            parts.append(html.Ul([html.Li(i) for i in view["items"]]))
+        details = html.Div(parts)
+
+        finding_cards.append(card(title, badge(sev), friendly, details, **{"data-sev": sev}))
 
     return topfixes, finding_cards
 
 
+app.clientside_callback(
+    ClientsideFunction(namespace="dqai", function_name="filterSeverity"),
+    Output("findings", "className"),
+    Output("top-fixes", "className"),
+    Input("sev-filter", "value"),
+)
+
+
 # Expose Flask server for Gunicorn
 server = app.server
 
 if __name__ == "__main__":
-    import os
     # local run (Render uses Gunicorn, not this branch)
     app.run(debug=False, host="0.0.0.0", port=int(os.environ.get("PORT", 8050)))
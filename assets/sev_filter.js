@@ -0,0 +1,13 @@
+// Severity filter: shows/hides the pre-rendered finding cards in the browser (no server round-trip).
+// Only container classes change (rules in theme.css), so cards React reuses across audits keep no stale state.
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+  dqai: {
+    filterSeverity: function (selected) {
+      var sel = selected || [];
+      var hidden = ["critical", "major", "minor"].filter(function (s) { return sel.indexOf(s) < 0; });
+      // top fixes: one list is pre-rendered per critical/major combination
+      var key = ["critical", "major"].filter(function (s) { return sel.indexOf(s) >= 0; }).join("-") || "none";
+      return [hidden.map(function (s) { return "hide-" + s; }).join(" "), "fixes-" + key];
+    },
+  },
+});
@@ -1,14 +1,16 @@
 \
 import argparse, json, pathlib
 import pandas as pd
+from run_audit import read_csv
 
 def infer_dtypes(df: pd.DataFrame):
-    return {c: str(t) for c, t in df.dtypes.items()}
+    return dict(zip(df.columns.tolist(), df.dtypes.astype(str).tolist()))
 
 def load_df(path: str) -> pd.DataFrame:
     p = pathlib.Path(path)
     if p.suffix.lower() == ".csv":
-        return pd.read_csv(p)
+        # same reader as the audit, so the baseline's dtypes match what it will see
+        return read_csv(p)
     if p.suffix.lower() in (".xlsx", ".xls"):
         return pd.read_excel(p)
     raise ValueError("Unsupported file format. Use CSV or Excel.")
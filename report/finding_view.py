@@ -0,0 +1,70 @@
+import json
+
+# optional: orjson (C) for the per-issue JSON shown in findings (report + app);
+# the stdlib fallback uses the same compact separators
+try:
+    import orjson
+
+    def issue_json(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    def issue_json(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+# duplicate-row indices listed before the "…"
+MAX_ROW_INDICES = 50
+
+def _cell(v):
+    # nested values (examples, column lists) are shown as JSON rather than Python repr
+    return issue_json(v) if isinstance(v, (dict, list)) else v
+
+def build_finding_view(r: dict) -> dict:
+    """Renderer-neutral view of one finding, consumed by the HTML report and the Dash app.
+
+    Returns {"title", "badge", "paras", "table", "items"}:
+      paras: [(text, strong)] paragraphs; strong (or None) is shown bold after "text: "
+      table: {"cols": [...], "rows": [[...], ...], "page_size": n} or None
+      items: JSON strings for issues that don't fit a table, or None
+    """
+    name = r.get("name", "")
+    issues = r.get("issues", [])
+    paras, table, items = [], None, None
+
+    # Duplicate rows: count + indices + sample table if provided
+    if name == "Duplicate Rows" and issues:
+        info = issues[0]
+        row_indices = info.get("row_indices", [])
+        sample_rows = info.get("sample_rows", [])
+        columns = info.get("columns", [])
+        paras.append(("Duplicate rows detected", int(info.get("duplicates", 0))))
+        if row_indices:
+            idx_text = ", ".join(str(x) for x in row_indices[:MAX_ROW_INDICES])
+            paras.append((f"Row indices (sample): {idx_text}" + (" …" if len(row_indices) > MAX_ROW_INDICES else ""), None))
+        if sample_rows and columns:
+            # columnar {"rows": [[...], ...]} or a list of per-row dicts
+            if isinstance(sample_rows, dict):
+                rows = sample_rows.get("rows", [])
+            else:
+                rows = [[row.get(c, "") for c in columns] for row in sample_rows]
+            table = {"cols": list(columns), "rows": rows, "page_size": 5}
+
+    # IQR outliers: explanation + sample of index/value pairs
+    elif name.startswith("IQR Outliers") and issues:
+        info = issues[0]
+        if info.get("explain"):
+            paras.append((info["explain"], None))
+        if "row_indices" in info:
+            paras.append(("Outlier rows (count)", len(info["row_indices"])))
+        pairs = [[p.get("index", ""), p.get("value", "")] for p in info.get("sample_values", [])]
+        if pairs:
+            table = {"cols": ["index", "value"], "rows": pairs, "page_size": 6}
+
+    # default: one table when every issue has the same keys, else a JSON list
+    elif issues and all(i.keys() == issues[0].keys() for i in issues):
+        cols = list(issues[0])
+        table = {"cols": cols, "rows": [[_cell(i[c]) for c in cols] for i in issues], "page_size": 10}
+    else:
+        items = [issue_json(i) for i in issues]
+
+    return {"title": name, "badge": (r.get("severity") or "").lower(),
+            "paras": paras, "table": table, "items": items}
@@ -1,5 +1,7 @@
-from pathlib import Path
-import html, json
+import re
+from contextlib import nullcontext
+
+from report.finding_view import build_finding_view
 
 THEME_CSS = """
 :root{ --bg1:#EAF2FF; --bg2:#DDE8FF; --text:#212529; --muted:#6B7280;
@@ -31,17 +33,45 @@ h1{margin:0 0 6px}
 .footer{color:var(--muted);font-size:12px;margin:18px 0;text-align:center;line-height:1.5}
 """
 
+# what reports embed: THEME_CSS without comments and runs of whitespace, built once
+_THEME_CSS_MIN = re.sub(r"\s+", " ", re.sub(r"/\*.*?\*/", "", THEME_CSS, flags=re.S)).strip()
+
+# one C-level pass per string; same output as html.escape(..., quote=True)
+_HTML_ESC = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
+
+def _esc(x) -> str:
+    return str(x).translate(_HTML_ESC)
+
 def _badge(sev: str) -> str:
     sev = (sev or "").lower()
     return f'<span class="badge {sev}">{sev.title()}</span>'
 
 def _table(headers, rows):
-    head = "".join(f"<th>{html.escape(str(h))}</th>" for h in headers)
-    body = "".join("<tr>" + "".join(f"<td>{html.escape(str(c))}</td>" for c in r) + "</tr>" for r in rows)
+    head = "".join(f"<th>{_esc(h)}</th>" for h in headers)
+    body = "".join("<tr>" + "".join(f"<td>{_esc(c)}</td>" for c in r) + "</tr>" for r in rows)
     return f'<table class="table"><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>'
 
-def render_report(ctx: dict, output_path: str) -> None:
-    file = html.escape(str(ctx.get("file","")))
+def _render_finding(r: dict) -> str:
+    view = build_finding_view(r)
+    issues_html = "".join(
+        f"<p>{_esc(text)}</p>" if strong is None else f"<p>{_esc(text)}: <strong>{_esc(strong)}</strong></p>"
+        for text, strong in view["paras"]
+    )
+    if view["table"]:
+        issues_html += _table(view["table"]["cols"], view["table"]["rows"])
+    if view["items"] is not None:
+        issues_html += "<ul>" + "".join(f"<li><code>{_esc(i)}</code></li>" for i in view["items"]) + "</ul>"
+
+    return f"""
+        <div class="finding">
+          <div class="card-title">{_esc(view["title"])} {_badge(view["badge"])}</div>
+          {issues_html}
+        </div>
+        """
+
+def render_report(ctx: dict, output) -> None:
+    """Write the report to `output`: a file path, or an open text stream."""
+    file = _esc(ctx.get("file",""))
     rows = int(ctx.get("rows",0))
     cols = ctx.get("columns",[])
     score = ctx.get("score",0)
@@ -67,70 +97,19 @@ def render_report(ctx: dict, output_path: str) -> None:
     </div>
     """
 
-    finding_blocks = []
-    for r in ctx.get("results", []):
-        name = html.escape(r.get("name",""))
-        sev = (r.get("severity") or "").lower()
-        issues = r.get("issues", [])
-
-        # default: simple JSON list
-        issues_html = "<ul>" + "".join(
-            f"<li><code>{html.escape(json.dumps(i, ensure_ascii=False))}</code></li>" for i in issues
-        ) + "</ul>"
-
-        # Missing values per-column
-        if name.startswith("Missing Values") and issues and all(("column" in i and "missing" in i) for i in issues):
-            rows_html = [[i["column"], int(i["missing"])] for i in issues]
-            issues_html = _table(["column", "missing"], rows_html)
-
-        # Dtype drift
-        if name == "Dtype Drift" and issues and all(set(["column","expected","actual"]).issubset(i) for i in issues):
-            rows_html = [[i["column"], i["expected"], i["actual"]] for i in issues]
-            issues_html = _table(["column","expected","actual"], rows_html)
-
-        # Duplicate rows: show count + indices + sample table if provided
-        if name == "Duplicate Rows" and issues:
-            info = issues[0]
-            dup_count = int(info.get("duplicates", 0))
-            row_indices = info.get("row_indices", [])
-            sample_rows = info.get("sample_rows", [])
-            columns = info.get("columns", [])
-            idx_text = ", ".join([html.escape(str(x)) for x in row_indices[:50]]) + (" …" if len(row_indices) > 50 else "")
-            tbl = ""
-            if sample_rows and columns:
-                rows_html = [[row.get(c, "") for c in columns] for row in sample_rows]
-                tbl = _table(columns, rows_html)
-            issues_html = f"<p>Duplicate rows detected: <strong>{dup_count}</strong></p>"
-            if row_indices:
-                issues_html += f"<p>Row indices (sample): {idx_text}</p>"
-            issues_html += tbl
-
-        # IQR outliers: add explanation + sample of index/value pairs
-        if name.startswith("IQR Outliers") and issues:
-            info = issues[0]
-            explain = info.get("explain")
-            sample = info.get("sample_values", [])
-            pairs = [[p.get("index",""), p.get("value","")] for p in sample]
-            tbl = _table(["index","value"], pairs) if pairs else ""
-            add = f"<p>{html.escape(explain)}</p>" if explain else ""
-            if "row_indices" in info:
-                add += f"<p>Outlier rows (count): <strong>{len(info['row_indices'])}</strong></p>"
-            issues_html = add + tbl
-
-        finding_blocks.append(f"""
-        <div class="finding">
-          <div class="card-title">{name} {_badge(sev)}</div>
-          {issues_html}
-        </div>
-        """)
-
-    html_doc = f"""<!DOCTYPE html>
+    # write piece by piece: each finding block is built, written and dropped
+    if hasattr(output, "write"):
+        sink = nullcontext(output)
+    else:
+        sink = open(output, "w", encoding="utf-8", buffering=1 << 20)
+    with sink as fh:
+        fh.write(f"""<!DOCTYPE html>
 <html>
 <head>
 <meta charset="utf-8"/>
 <title>DQ-AI — Data Quality Report</title>
 <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;600&display=swap" rel="stylesheet">
-<style>{THEME_CSS}</style>
+<style>{_THEME_CSS_MIN}</style>
 </head>
 <body>
   <div class="container">
@@ -139,15 +118,19 @@ def render_report(ctx: dict, output_path: str) -> None:
       <p class="subtitle">File: {file} · Rows: {rows} · Columns: {len(cols)}</p>
     </header>
 
-    {summary_html}
+    """)
+        fh.write(summary_html)
+        fh.write("""
 
     <section class="section">
       <div class="card"><div class="card-title">Findings</div></div>
-      {''.join(finding_blocks)}
+      """)
+        for r in ctx.get("results", []):
+            fh.write(_render_finding(r))
+        fh.write(f"""
     </section>
 
     <div class="footer">{credit}<br/>{privacy}</div>
   </div>
 </body>
-</html>"""
-    Path(output_path).write_text(html_doc, encoding="utf-8")
+</html>""")
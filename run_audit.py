@@ -1,23 +1,100 @@
 \
 import argparse, json, pathlib, re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 
 import numpy as np
 import pandas as pd
-from pandas.api.types import is_numeric_dtype, is_datetime64_any_dtype, is_string_dtype
+from pandas.api.types import is_bool_dtype, is_numeric_dtype, is_datetime64_any_dtype, is_string_dtype
 from scipy.stats import chisquare
 from rapidfuzz import fuzz, process as rf_process
 from report.html_report import render_report
 
 SEVERITY_WEIGHTS = {"critical": 3, "major": 2, "minor": 1}
 
+# checks run concurrently from this many rows; below it thread start-up costs more than it saves
+PARALLEL_MIN_ROWS = 100_000
+
 SEMANTIC_PATTERNS = {
     "email": re.compile(r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$"),
     "uk_postcode": re.compile(r"^(GIR ?0AA|(?:(?:[A-Z][0-9]{1,2}|[A-Z][A-HJ-Y][0-9]{1,2}|[A-Z][0-9][A-Z]|[A-Z][A-HJ-Y][0-9]?[A-Z]) ?[0-9][A-Z]{2}))$", re.I),
 }
 
-@dataclass
+# postcode-like gate for check_semantic_regex; values per column sampled by that gate and
+# by the cardinality probe of check_rare_categories
+_ALPHA_DIGIT = re.compile(r"[A-Z]\d")
+GATE_SAMPLE = 10_000
+# a column whose sample is more than this share distinct values is reported as high-cardinality
+HIGH_CARD_RATIO = 0.8
+# from this many columns, full-row duplicates are found via per-row hashes of the column codes
+WIDE_DUP_COLS = 50
+
+# optional: Arrow's multithreaded CSV reader (falls back to pandas' C engine) and
+# its re2-backed string kernels for the semantic checks (fall back to `re`)
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# optional: numba-compiled outlier counter (falls back to numpy)
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def semantic_match_counts(sample: Optional[pd.Series], keys: List[str], arr=None) -> Dict[str, int]:
+    """Number of `sample` values matching each SEMANTIC_PATTERNS[key] (re.match semantics).
+
+    `arr` is `sample` as an Arrow array (`sample` may be None when `arr` is given); re2 over
+    its buffers is the fast path, `re` over `sample` the fallback.
+    """
+    if not keys:
+        return {}
+    # re2's $ only matches at the very end, Python's also before a final newline
+    if arr is not None and not pc.any(pc.match_substring(arr, "\n")).as_py():
+        try:
+            return {k: pc.sum(pc.match_substring_regex(arr, SEMANTIC_PATTERNS[k].pattern,
+                                                       ignore_case=bool(SEMANTIC_PATTERNS[k].flags & re.I))).as_py() or 0
+                    for k in keys}
+        except pa.ArrowInvalid:
+            pass  # a pattern re2 can't compile (backreferences, lookarounds): use `re` below
+    if sample is None:
+        sample = arr.to_pandas()
+    return {k: int(sample.str.match(SEMANTIC_PATTERNS[k]).sum()) for k in keys}
+
+def _count_outliers_np(arr, lo, hi):
+    """numpy version of count_outliers."""
+    return ((arr < lo) | (arr > hi)).sum(axis=0)  # NaN compares False
+
+if njit is not None:
+    # not parallel=True: a parallel kernel launched off the main thread (run_checks' pool)
+    # leaves numba's TBB threading layer running and the interpreter never exits
+    @njit(cache=True)
+    def count_outliers(arr, lo, hi):
+        """Values of each column j of `arr` (N, K) outside [lo[j], hi[j]], without temporary masks.
+
+        Pass `arr` in Fortran order so each column is contiguous.
+        """
+        n, k = arr.shape
+        out = np.zeros(k, dtype=np.int64)
+        for j in range(k):
+            lo_j = lo[j]
+            hi_j = hi[j]
+            c = 0
+            for i in range(n):
+                v = arr[i, j]
+                if v < lo_j or v > hi_j:
+                    c += 1
+            out[j] = c
+        return out
+else:
+    count_outliers = _count_outliers_np
+
+@dataclass(slots=True, frozen=True)
 class CheckResult:
     name: str
     severity: str
@@ -27,14 +104,100 @@ class CheckResult:
 def norm(x: float, cap: float) -> float:
     return max(0.0, min(1.0, x / cap))
 
-def load_df(path: str) -> pd.DataFrame:
+def _has_hex_prefix(src) -> bool:
+    """Whether the raw bytes of CSV path or binary file object `src` contain `0x`/`0X`."""
+    f = src if hasattr(src, "read") else open(src, "rb")
+    try:
+        tail = b""
+        while True:
+            chunk = f.read(1 << 24)
+            if not chunk:
+                return False
+            buf = tail + chunk  # a match may straddle two chunks
+            if b"0x" in buf or b"0X" in buf:
+                return True
+            tail = chunk[-1:]
+    finally:
+        if f is src:
+            src.seek(0)
+        else:
+            f.close()
+
+def read_csv(src) -> pd.DataFrame:
+    """Parse a CSV path or binary file object with the pyarrow engine, falling back to the C engine.
+
+    Arrow infers types from the first block. Where it is known to read a file
+    differently from the C engine, the C engine is used instead:
+    blank or repeated header names (`Unnamed: 0`, `name.1` mangling), date/time
+    columns (re-rendered even when read as text), `0x` text in integer columns
+    (parsed as hex), integers past int64 (float64, not uint64), bool columns
+    with blanks (None, not NaN), header-only files (float64, not object) and
+    non-UTF-8 text (read as binary).
+    """
+    if HAS_PYARROW:
+        try:
+            schema = pacsv.open_csv(src).schema
+            if hasattr(src, "seek"):
+                src.seek(0)
+            names = schema.names
+            if (all(names) and len(set(names)) == len(names)
+                    and not any(pa.types.is_binary(f.type) or pa.types.is_temporal(f.type) for f in schema)
+                    and not (any(pa.types.is_integer(f.type) for f in schema) and _has_hex_prefix(src))):
+                df = pd.read_csv(src, engine="pyarrow")
+                if (len(df) and not (df.select_dtypes("float").abs().max() >= 2.0 ** 63).any()
+                        and not any(pa.types.is_boolean(f.type) and df[f.name].dtype != bool for f in schema)):
+                    return df
+        except Exception:
+            pass
+        if hasattr(src, "seek"):
+            src.seek(0)
+    return pd.read_csv(src, engine="c", low_memory=False, cache_dates=True, encoding_errors="ignore")
+
+def to_arrow(df: pd.DataFrame):
+    """`df` as a pyarrow Table (NaN/NaT/None become nulls), or None without pyarrow or for mixed-type columns."""
+    if not HAS_PYARROW:
+        return None
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowException, ValueError):
+        return None
+
+def load_df(path: str, cache: bool = False) -> pd.DataFrame:
+    """Load a CSV/Excel file. With `cache`, a CSV is also written to a `<name>.audit.parquet`
+    sibling on first read, and later runs load that instead while it is newer than the CSV."""
     p = pathlib.Path(path)
     if p.suffix.lower() == ".csv":
-        return pd.read_csv(p)
+        if not (cache and HAS_PYARROW):
+            return read_csv(p)
+        pq = p.with_suffix(".audit.parquet")
+        if pq.exists() and pq.stat().st_mtime >= p.stat().st_mtime:
+            return pd.read_parquet(pq)
+        df = read_csv(p)
+        try:
+            df.to_parquet(pq, index=False, compression="zstd")
+        except (OSError, pa.ArrowException):
+            pq.unlink(missing_ok=True)  # read-only dir or a column Arrow can't store: just skip the cache
+        return df
     if p.suffix.lower() in (".xlsx", ".xls"):
         return pd.read_excel(p)
     raise ValueError("Unsupported file format. Use CSV or Excel.")
 
+def classify_columns(df: pd.DataFrame) -> Dict[str, List[int]]:
+    """Positions of the numeric, text, category and datetime columns of `df`, resolved once for all checks."""
+    kinds = {"numeric": [], "text": [], "category": [], "datetime": []}
+    for i, t in enumerate(df.dtypes):
+        if is_numeric_dtype(t) and not is_bool_dtype(t):
+            kinds["numeric"].append(i)
+        elif is_datetime64_any_dtype(t):
+            kinds["datetime"].append(i)
+        else:
+            if t == "category":
+                kinds["category"].append(i)
+            # object and category columns need a look at the values (mixed types are not text)
+            if is_string_dtype(df.iloc[:, i] if t == object or t == "category" else t):
+                kinds["text"].append(i)
+    return kinds
+
 def check_schema(df: pd.DataFrame, baseline: Optional[Dict[str, Any]]) -> List[CheckResult]:
     issues = []
     if not baseline: 
@@ -60,77 +223,194 @@ def check_schema(df: pd.DataFrame, baseline: Optional[Dict[str, Any]]) -> List[C
 
 def check_primary_key(df: pd.DataFrame, pk: List[str]) -> List[CheckResult]:
     if not pk: return []
-    dupes = df.duplicated(subset=pk).sum()
+    # one hash pass: group id per row, then group sizes give both the count and the example rows
+    codes = df.groupby(pk, sort=False, dropna=False).ngroup().to_numpy()
+    sizes = np.bincount(codes)
+    dupes = len(codes) - len(sizes)
     if dupes > 0:
-        ex = df[df.duplicated(subset=pk, keep=False)][pk].head(5).to_dict(orient="records")
+        ex = df[pk].iloc[np.flatnonzero(sizes[codes] > 1)[:5]].to_dict(orient="records")
         return [CheckResult("Primary Key Uniqueness", "critical", [{"duplicates": int(dupes), "examples": ex}], impact=norm(dupes, max(10, len(df)*0.02)))]
     return []
 
-def check_missing_duplicates_types(df: pd.DataFrame) -> List[CheckResult]:
+def duplicate_row_mask(df: pd.DataFrame, keep="first") -> np.ndarray:
+    """Same mask as df.duplicated(keep=keep).
+
+    duplicated() factorizes every column and then combines the codes pairwise, which gets
+    slow on wide frames. There, the codes are folded into one 64-bit hash per row instead,
+    and only rows whose hash repeats go through the exact duplicated().
+    """
+    if df.shape[1] < WIDE_DUP_COLS:
+        return df.duplicated(keep=keep).to_numpy()
+    h = np.zeros(len(df), dtype=np.uint64)
+    mult = np.random.RandomState(0).randint(1, 2**62, size=df.shape[1], dtype=np.int64).astype(np.uint64) | np.uint64(1)
+    for j in range(df.shape[1]):
+        codes, _ = pd.factorize(df.iloc[:, j])  # same equality as duplicated(): NaN/None alike, -0.0 == 0.0
+        h = h * np.uint64(0x9E3779B97F4A7C15) + codes.astype(np.uint64) * mult[j]
+    # equal rows always share a hash; a shared hash may still be a collision, so confirm exactly
+    cand = pd.Series(h).duplicated(keep=False).to_numpy()
+    mask = np.zeros(len(df), dtype=bool)
+    mask[cand] = df[cand].duplicated(keep=keep).to_numpy()
+    return mask
+
+def count_duplicate_rows(df: pd.DataFrame) -> int:
+    """Same count as df.duplicated().sum()."""
+    return int(duplicate_row_mask(df).sum())
+
+def check_missing_duplicates_types(df: pd.DataFrame, tbl=None) -> List[CheckResult]:
     issues = []
-    miss = df.isna().sum()
+    if tbl is not None:
+        # Arrow keeps a null count per column: no boolean frame to build and reduce
+        miss = pd.Series([col.null_count for col in tbl.columns], index=df.columns)
+    else:
+        miss = len(df) - df.count()  # per-column non-null counts, no boolean frame either
     miss = miss[miss > 0]
     if len(miss) > 0:
         issues.append(CheckResult("Missing Values", "major", [{"column": c, "missing": int(v)} for c, v in miss.to_dict().items()], impact=norm(int(miss.sum()), max(10, len(df)*0.05))))
-    dups = int(df.duplicated().sum())
+    dups = count_duplicate_rows(df)
     if dups > 0:
         issues.append(CheckResult("Duplicate Rows", "major", [{"duplicates": dups}], impact=norm(dups, max(10, len(df)*0.03))))
     dtypes_issue = [{"column": c, "dtype": str(t)} for c, t in df.dtypes.items() if str(t) == "object"]
     # Not an issue by itself, but note prevalence of object types
     return issues
 
-def check_outliers_iqr(df: pd.DataFrame) -> List[CheckResult]:
+def check_outliers_iqr(df: pd.DataFrame, tbl=None, kinds=None) -> List[CheckResult]:
     issues = []
-    for c in df.columns:
-        if is_numeric_dtype(df[c]):
-            s = pd.to_numeric(df[c], errors="coerce").dropna()
-            if len(s) < 10: 
-                continue
-            q1, q3 = np.percentile(s, [25, 75])
-            iqr = max(q3 - q1, 1e-9)
-            lo, hi = q1 - 1.5*iqr, q3 + 1.5*iqr
-            cnt = int(((s < lo) | (s > hi)).sum())
-            if cnt > 0:
-                issues.append(CheckResult(f"IQR Outliers: {c}", "major", [{"count": cnt, "lo": float(lo), "hi": float(hi)}], impact=norm(cnt, max(10, len(s)*0.05))))
+    # numeric columns by position, so they line up with the Arrow table's columns
+    pos = (kinds or classify_columns(df))["numeric"]
+    if not pos:
+        return issues
+    num = df.iloc[:, pos]
+    # q1/q3 for every numeric column, then one counting pass over the block (NaN never compares true)
+    if tbl is not None:
+        # Arrow selects the quantiles in place on each column; pandas would copy the block first
+        q1, q3 = np.array([pc.quantile(tbl.column(i), q=[0.25, 0.75]).to_pylist() for i in pos], dtype=float).T
+        n = np.array([len(tbl) - tbl.column(i).null_count for i in pos])
+    else:
+        q1, q3 = num.quantile([0.25, 0.75]).to_numpy(dtype=float)
+        n = num.count().to_numpy()
+    iqr = np.maximum(q3 - q1, 1e-9)
+    lo, hi = q1 - 1.5*iqr, q3 + 1.5*iqr
+    arr = np.asfortranarray(num.to_numpy(dtype=float, na_value=np.nan))
+    counts = count_outliers(arr, lo, hi)
+    for j, c in enumerate(num.columns):
+        cnt = int(counts[j])
+        if n[j] >= 10 and cnt > 0:
+            issues.append(CheckResult(f"IQR Outliers: {c}", "major", [{"count": cnt, "lo": float(lo[j]), "hi": float(hi[j])}], impact=norm(cnt, max(10, int(n[j])*0.05))))
     return issues
 
-def check_rare_categories(df: pd.DataFrame, min_ratio: float = 0.01) -> List[CheckResult]:
+def _arrow_text(tbl, i: int):
+    """Non-null values of text column `i` of `tbl` as an Arrow string array (category dictionaries decoded), or None."""
+    if tbl is None:
+        return None
+    col = tbl.column(i)
+    if pa.types.is_dictionary(col.type):
+        col = col.cast(col.type.value_type)
+    if not (pa.types.is_string(col.type) or pa.types.is_large_string(col.type)):
+        return None
+    return pc.drop_null(col)
+
+def _sample_positions(n: int):
+    """The GATE_SAMPLE positions Series.sample(GATE_SAMPLE, random_state=0) would pick from n values, or None if n is smaller."""
+    return np.random.RandomState(0).choice(n, GATE_SAMPLE, replace=False) if n > GATE_SAMPLE else None
+
+def check_rare_categories(df: pd.DataFrame, min_ratio: float = 0.01, kinds=None, tbl=None) -> List[CheckResult]:
     out = []
-    for c in df.columns:
-        if is_string_dtype(df[c]) or df[c].dtype == "category":
-            vc = df[c].astype(str).value_counts(normalize=True)
-            rare = vc[vc < min_ratio]
-            if len(rare) > 0:
-                out.append(CheckResult(f"Rare Categories: {c}", "minor", [{"n_rare": int(len(rare)), "examples": dict(rare.head(5))}], impact=norm(len(rare), 50)))
+    kinds = kinds or classify_columns(df)
+    pos = sorted(set(kinds["text"]) | set(kinds["category"]))
+    if not pos:
+        return out
+    # mostly-distinct columns (free text, ids, emails) are reported as such from a sample, rather
+    # than counting every value only to list nearly all of them as rare
+    high = {}
+    for i in pos:
+        arr = _arrow_text(tbl, i)
+        n = len(arr) if arr is not None else int(df.iloc[:, i].count())
+        if n * min_ratio <= 1:
+            continue  # too few values for any of them to be rare
+        take = _sample_positions(n)
+        if arr is not None:
+            nd = pc.count_distinct(arr if take is None else arr.take(take)).as_py()
+        else:
+            s = df.iloc[:, i].dropna()
+            nd = (s if take is None else s.iloc[take]).nunique()
+        m = n if take is None else len(take)
+        if nd > HIGH_CARD_RATIO * m:
+            high[i] = (int(nd), m)
+    rest = [i for i in pos if i not in high]
+    present = set()
+    if rest:
+        # one (column, value) hash aggregation over the stacked text block instead of one per column
+        long = df.iloc[:, rest].astype(str).melt(var_name="col", value_name="val")
+        counts = long.groupby(["col", "val"], sort=False).size()
+        ratio = counts / long["val"].notna().groupby(long["col"]).sum().reindex(counts.index, level="col")
+        rare = ratio[ratio < min_ratio]
+        present = set(rare.index.get_level_values("col"))
+    for i in pos:
+        c = df.columns[i]
+        if i in high:
+            nd, m = high[i]
+            out.append(CheckResult(f"High Cardinality: {c}", "minor", [{"distinct": nd, "sampled": m}], impact=norm(nd, 50)))
+            continue
+        if c not in present:
+            continue
+        # value_counts order: most frequent first, ties in first-seen order
+        vc = rare.xs(c, level="col").sort_values(ascending=False, kind="stable")
+        out.append(CheckResult(f"Rare Categories: {c}", "minor", [{"n_rare": int(len(vc)), "examples": dict(vc.head(5))}], impact=norm(len(vc), 50)))
     return out
 
-def check_semantic_regex(df: pd.DataFrame) -> List[CheckResult]:
+def check_semantic_regex(df: pd.DataFrame, kinds=None, tbl=None) -> List[CheckResult]:
     found = []
-    for c in df.columns:
-        if is_string_dtype(df[c]):
-            sample = df[c].dropna().astype(str)
-            if len(sample) == 0:
-                continue
-            # Heuristic: if >50% look like emails/postcodes and >30% fail pattern, flag
-            like_email = sample.str.contains("@").mean() > 0.5
-            like_pc = sample.str.contains(r"[A-Z]\d", regex=True).mean() > 0.5
-            if like_email:
-                bad = (~sample.str.match(SEMANTIC_PATTERNS["email"])).mean()
-                if bad > 0.3:
-                    found.append(CheckResult(f"Semantic Violations (email) in {c}", "major", [{"fail_rate": round(float(bad),3)}], impact=min(1.0, bad)))
-            if like_pc:
-                bad = (~sample.str.match(SEMANTIC_PATTERNS["uk_postcode"])).mean()
-                if bad > 0.3:
-                    found.append(CheckResult(f"Semantic Violations (UK postcode) in {c}", "major", [{"fail_rate": round(float(bad),3)}], impact=min(1.0, bad)))
+    for i in (kinds or classify_columns(df))["text"]:
+        c = df.columns[i]
+        # straight from the shared Arrow table when there is one: no Python str objects to build
+        arr = _arrow_text(tbl, i)
+        sample = df.iloc[:, i].dropna().astype(str) if arr is None else None
+        n = len(arr) if arr is not None else len(sample)
+        if n == 0:
+            continue
+        # Heuristic: if >50% look like emails/postcodes and >30% fail pattern, flag.
+        # The gate is estimated on a fixed sample; only the match rates need every value.
+        take = _sample_positions(n)
+        if arr is not None or HAS_PYARROW:
+            if arr is not None:
+                g = arr if take is None else arr.take(take)
+            else:
+                g = pa.array(sample if take is None else sample.iloc[take])
+            like_email = pc.mean(pc.match_substring(g, "@")).as_py() > 0.5
+            like_pc = pc.mean(pc.match_substring_regex(g, r"[A-Z]\d")).as_py() > 0.5
+        else:
+            gate = sample if take is None else sample.iloc[take]
+            like_email = gate.str.contains("@", regex=False).mean() > 0.5
+            like_pc = gate.str.contains(_ALPHA_DIGIT).mean() > 0.5
+        if not (like_email or like_pc):
+            continue
+        if arr is None and HAS_PYARROW:
+            arr = pa.array(sample)
+        hits = semantic_match_counts(sample, [k for k, on in (("email", like_email), ("uk_postcode", like_pc)) if on], arr)
+        if like_email:
+            # exactly (~match).mean(); 1 - rate can land an ulp above 0.3 (21 of 70 bad)
+            bad = (n - hits["email"]) / n
+            if bad > 0.3:
+                found.append(CheckResult(f"Semantic Violations (email) in {c}", "major", [{"fail_rate": round(float(bad),3)}], impact=min(1.0, bad)))
+        if like_pc:
+            bad = (n - hits["uk_postcode"]) / n
+            if bad > 0.3:
+                found.append(CheckResult(f"Semantic Violations (UK postcode) in {c}", "major", [{"fail_rate": round(float(bad),3)}], impact=min(1.0, bad)))
     return found
 
-def check_dates(df: pd.DataFrame) -> List[CheckResult]:
+def check_dates(df: pd.DataFrame, kinds=None) -> List[CheckResult]:
     issues = []
-    date_cols = [c for c in df.columns if ("date" in c.lower() or is_datetime64_any_dtype(df[c]))]
+    dt_pos = set((kinds or classify_columns(df))["datetime"])
+    date_cols = [c for i, c in enumerate(df.columns) if ("date" in c.lower() or i in dt_pos)]
     parsed = {}
     for c in date_cols:
+        s = df[c]
+        # already datetime64: nothing to parse, just put it on UTC like to_datetime(utc=True) would
+        if is_datetime64_any_dtype(s):
+            parsed[c] = s.dt.tz_convert("UTC") if s.dt.tz is not None else s.dt.tz_localize("UTC")
+            continue
         try:
-            parsed[c] = pd.to_datetime(df[c], errors="coerce", utc=True)
+            parsed[c] = pd.to_datetime(s, errors="coerce", utc=True)
         except Exception:
             continue
     for c, s in parsed.items():
@@ -143,10 +423,30 @@ def check_dates(df: pd.DataFrame) -> List[CheckResult]:
             issues.append(CheckResult("Temporal Rule: ship_date ≥ order_date", "major", [{"violations": bad}], impact=norm(bad, max(10, len(df)*0.05))))
     return issues
 
+def run_checks(df: pd.DataFrame, baseline: Optional[Dict[str, Any]]) -> List[CheckResult]:
+    """Run every check on `df`; results keep the check order.
+
+    The checks only read `df`, and their heavy parts run in pandas/NumPy/Arrow
+    code that releases the GIL, so large frames use one thread per check.
+    """
+    tbl = to_arrow(df)  # converted once, shared by the checks that can use it
+    kinds = classify_columns(df)
+    tasks = [(check_schema, df, baseline)]
+    if baseline and "primary_key" in baseline:
+        tasks.append((check_primary_key, df, baseline.get("primary_key", [])))
+    tasks += [(check_missing_duplicates_types, df, tbl), (check_outliers_iqr, df, tbl, kinds),
+              (check_rare_categories, df, 0.01, kinds, tbl), (check_semantic_regex, df, kinds, tbl), (check_dates, df, kinds)]
+    if len(df) < PARALLEL_MIN_ROWS:
+        parts = [fn(*args) for fn, *args in tasks]
+    else:
+        with ThreadPoolExecutor(max_workers=len(tasks)) as ex:
+            parts = list(ex.map(lambda t: t[0](*t[1:]), tasks))
+    return [r for part in parts for r in part]
+
 def compute_score(results: List[CheckResult]) -> float:
-    penalty = 0.0
-    for r in results:
-        penalty += SEVERITY_WEIGHTS.get(r.severity, 1) * r.impact * 10  # scale per check
+    w = np.fromiter((SEVERITY_WEIGHTS.get(r.severity, 1) for r in results), dtype=np.float64, count=len(results))
+    imp = np.fromiter((r.impact for r in results), dtype=np.float64, count=len(results))
+    penalty = float(w @ imp) * 10  # scale per check
     score = max(0.0, 100.0 - penalty)
     return round(score, 1)
 
@@ -155,31 +455,24 @@ def main():
     ap.add_argument("--input", required=True, help="Path to CSV/XLSX to audit")
     ap.add_argument("--baseline", default=None, help="Path to baseline_schema.json (optional)")
     ap.add_argument("--out", default="report.html", help="Output HTML report path")
+    ap.add_argument("--parquet-cache", action="store_true", help="Keep a <name>.audit.parquet copy of a CSV input and reuse it on later runs")
     args = ap.parse_args()
 
-    df = load_df(args.input)
+    df = load_df(args.input, cache=args.parquet_cache)
     baseline = None
     if args.baseline:
         with open(args.baseline, "r") as f:
             baseline = json.load(f)
 
-    results: List[CheckResult] = []
     # Run checks
-    results += check_schema(df, baseline)
-    if baseline and "primary_key" in baseline:
-        results += check_primary_key(df, baseline.get("primary_key", []))
-    results += check_missing_duplicates_types(df)
-    results += check_outliers_iqr(df)
-    results += check_rare_categories(df)
-    results += check_semantic_regex(df)
-    results += check_dates(df)
+    results = run_checks(df, baseline)
 
     # Build summary
     summary = {
         "file": args.input,
         "rows": int(len(df)),
         "columns": list(df.columns),
-        "results": [r.__dict__ for r in results],
+        "results": [{"name": r.name, "severity": r.severity, "issues": r.issues, "impact": r.impact} for r in results],
     }
     summary["score"] = compute_score(results)
     # Save HTML
@@ -0,0 +1,96 @@
+import base64
+import itertools
+import json
+import re
+import shutil
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import app
+from conftest import ROOT
+
+
+@pytest.mark.skipif(app.njit is None, reason="numba not installed")
+def test_iqr_outliers_np_matches_kernel():
+    rng = np.random.default_rng(0)
+    for _ in range(300):
+        n, k = int(rng.integers(1, 200)), int(rng.integers(1, 6))
+        # few distinct magnitudes of both signs, so ties at the cut are common
+        block = rng.integers(-6, 7, size=(n, k)).astype(np.float64)
+        block[rng.random((n, k)) < 0.05] = np.nan
+        block = np.asfortranarray(block)
+        lo = rng.integers(-4, 1, size=k).astype(np.float64)
+        hi = rng.integers(0, 5, size=k).astype(np.float64)
+        mask, top = app.iqr_outliers(block, lo, hi)
+        mask_np, top_np = app._iqr_outliers_np(block, lo, hi)
+        np.testing.assert_array_equal(mask, mask_np)
+        np.testing.assert_array_equal(top, top_np)
+
+
+def test_iqr_outliers_from_thread_exits():
+    code = (
+        "import threading, numpy as np, app\n"
+        "b = np.asfortranarray(np.arange(200.0).reshape(100, 2))\n"
+        "t = threading.Thread(target=app.iqr_outliers, args=(b, np.zeros(2), np.full(2, 50.0)))\n"
+        "t.start(); t.join()\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, timeout=120)
+    assert proc.returncode == 0, proc.stderr
+
+
+def _css_display(css, container_id, container_classes, attr, value):
+    """`display` the theme.css rules give an element [attr=value] inside #container_id.
+
+    Enough of the cascade for the severity filter rules: `ancestor target` selectors
+    of ids, classes and attributes, highest specificity wins, later rules on ties.
+    """
+    best, shown = None, True
+    for order, (selectors, body) in enumerate(re.findall(r"([^{}]+)\{([^}]*)\}", css)):
+        m = re.search(r"display\s*:\s*([\w-]+)", body)
+        if not m:
+            continue
+        for sel in selectors.split(","):
+            # compound selectors; attribute values may hold spaces
+            parts = re.findall(r"(?:\[[^\]]*\]|[^\s\[])+", re.sub(r"/\*.*?\*/", "", sel, flags=re.S))
+            if len(parts) != 2:
+                continue
+            anc, tgt = parts
+            ids, classes = re.findall(r"#([\w-]+)", anc), re.findall(r"\.([\w-]+)", anc)
+            attrs = re.findall(r'\[([\w-]+)(?:="([^"]*)")?\]', tgt)
+            if not attrs or any(i != container_id for i in ids) or not set(classes) <= set(container_classes):
+                continue
+            if any(a != attr or (v and v != value) for a, v in attrs):
+                continue
+            spec = (len(ids), len(classes) + len(attrs), order)
+            if best is None or spec > best:
+                best, shown = spec, m.group(1) != "none"
+    return shown
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+def test_severity_filter_shows_matching_groups():
+    css = (ROOT / "assets" / "theme.css").read_text()
+    sevs = ["critical", "major", "minor"]
+    for selected in itertools.chain.from_iterable(itertools.combinations(sevs, r) for r in range(4)):
+        script = ('global.window = {}; require(%s); process.stdout.write(JSON.stringify('
+                  'window.dash_clientside.dqai.filterSeverity(%s)))') % (
+            json.dumps(str(ROOT / "assets" / "sev_filter.js")), json.dumps(list(selected)))
+        findings_cls, fixes_cls = json.loads(subprocess.run(["node", "-e", script], capture_output=True,
+                                                            text=True, check=True).stdout)
+        for sev in sevs:
+            assert _css_display(css, "findings", findings_cls.split(), "data-sev", sev) == (sev in selected)
+        want = " ".join(s for s in ("critical", "major") if s in selected) or "none"
+        for key, _ in app.TOP_FIX_GROUPS:
+            assert _css_display(css, "top-fixes", fixes_cls.split(), "data-fixes", key) == (key == want), (selected, key)
+
+
+def test_duplicate_sample_rows_keep_column_types():
+    csv = "id,amount\n9007199254740993,1.5\n1,2.0\n9007199254740993,1.5\n"
+    contents = "data:text/csv;base64," + base64.b64encode(csv.encode()).decode()
+    out = app._run_audit.uncached("d", None, "dup.csv", contents, None)
+    dup = next(r for r in out["results"] if r["name"] == "Duplicate Rows")["issues"][0]
+    assert dup["sample_rows"] == {"rows": [[9007199254740993, 1.5], [9007199254740993, 1.5]]}
+    assert all(type(row[0]) is int for row in dup["sample_rows"]["rows"])
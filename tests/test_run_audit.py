@@ -0,0 +1,96 @@
+import io
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import run_audit as ra
+from conftest import ROOT
+
+
+def test_cli_exits_after_threaded_checks(tmp_path):
+    # from PARALLEL_MIN_ROWS rows the checks run on pool threads; the CLI must still exit
+    n = ra.PARALLEL_MIN_ROWS
+    rng = np.random.default_rng(0)
+    pd.DataFrame({
+        "id": np.arange(n),
+        "amount": rng.standard_normal(n) * 50 + 100,
+        "email": [f"user{i}@example.com" for i in range(n)],
+    }).to_csv(tmp_path / "big.csv", index=False)
+    proc = subprocess.run(
+        [sys.executable, "run_audit.py", "--input", str(tmp_path / "big.csv"), "--out", str(tmp_path / "report.html")],
+        cwd=ROOT, capture_output=True, text=True, timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert "Report written" in proc.stdout
+
+
+def _semantic_reference(df):
+    """check_semantic_regex as it was before the Arrow/re2 paths."""
+    found = []
+    for c in df.columns:
+        sample = df[c].dropna().astype(str)
+        if len(sample) == 0:
+            continue
+        for key, label, like in (("email", "email", sample.str.contains("@").mean() > 0.5),
+                                 ("uk_postcode", "UK postcode", sample.str.contains(r"[A-Z]\d", regex=True).mean() > 0.5)):
+            if like:
+                bad = (~sample.str.match(ra.SEMANTIC_PATTERNS[key])).mean()
+                if bad > 0.3:
+                    found.append((f"Semantic Violations ({label}) in {c}", [{"fail_rate": round(float(bad), 3)}], min(1.0, bad)))
+    return found
+
+
+def test_semantic_fail_rate_matches_reference():
+    rng = np.random.default_rng(0)
+    pools = {
+        "email": (["a@b.co", "x.y@mail.example.org"], ["a@b", "@b.co", "a b@c.de"]),
+        "pc": (["SW1A 1AA", "M1 1AE", "b33 8th"], ["SW1A1", "Z9 9Z9", "A1"]),
+    }
+    for _ in range(300):
+        n = int(rng.integers(1, 90))
+        cols = {}
+        for name, (good, bad) in pools.items():
+            n_bad = int(rng.integers(0, n + 1))
+            vals = list(rng.choice(good, n - n_bad)) + list(rng.choice(bad, n_bad))
+            cols[name] = pd.Series(rng.permutation(np.array(vals, dtype=object)), dtype=object)
+        df = pd.DataFrame(cols)
+        want = _semantic_reference(df)
+        for tbl in (None, ra.to_arrow(df)):
+            got = [(r.name, r.issues, r.impact) for r in ra.check_semantic_regex(df, tbl=tbl)]
+            assert got == want
+    # 21 of 70 bad: 1 - 49/70 is 0.30000000000000004, but the rate is exactly 0.3
+    df = pd.DataFrame({"email": ["a@b.co"] * 49 + ["a@b"] * 21})
+    assert ra.check_semantic_regex(df) == []
+
+
+@pytest.mark.parametrize("text", [
+    "id,name,name,amount\n1,a,b,2\n",
+    "t,u,v,w\n2024-01-01T10:00:00+01:00,10:00,2024-01-01T10:00Z,2024-01-01T10:00\n",
+    "x,y\n18446744073709551615,1.5\n1,\n",
+    "a,b\n1,2.5\n,x\n",
+    ",a\n0,1\n1,2\n",
+    "a,a,a.1\n1,2,3\n",
+    "x,y\n0x1F,1\n0X2a,2\n",
+    "a,b\n",
+    "a,b\nTrue,1\n,2\nFalse,3\n",
+])
+def test_read_csv_matches_c_engine(text):
+    # bytes through a file object, as uploads arrive
+    pd.testing.assert_frame_equal(ra.read_csv(io.BytesIO(text.encode())), pd.read_csv(io.StringIO(text)))
+
+
+@pytest.mark.parametrize("width", [3, ra.WIDE_DUP_COLS])
+def test_duplicate_row_mask_matches_duplicated(width):
+    rng = np.random.default_rng(0)
+    n = 400
+    cols = {f"c{j}": rng.integers(0, 2, n) for j in range(width - 2)}
+    # values hash_pandas_object would get wrong: 1 vs "1", 0.0 vs -0.0, NaN vs None
+    cols["mixed"] = pd.Series(rng.choice(np.array([1, "1", None, np.nan], dtype=object), n), dtype=object)
+    cols["zero"] = rng.choice([0.0, -0.0, 1.5], n)
+    df = pd.DataFrame(cols)
+    for keep in ("first", False):
+        np.testing.assert_array_equal(ra.duplicate_row_mask(df, keep=keep), df.duplicated(keep=keep).to_numpy())
+    assert ra.count_duplicate_rows(df) == df.duplicated().sum()